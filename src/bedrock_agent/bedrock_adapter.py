@@ -4,7 +4,6 @@ Converts Bedrock Agent requests to Lambda function calls and provides real LLM i
 """
 
 import json
-import sys
 import os
 import re
 import boto3
@@ -21,6 +20,64 @@ from logger import get_logger
 class BedrockAgentAdapter:
     """Hybrid adapter integrating Lambda functions with real Bedrock LLM"""
     
+    # Normalization applied to known agent parameters during extraction
+    PARAMETER_COERCIONS = {
+        "ticker": lambda value: str(value).strip().upper(),
+        "depth": lambda value: str(value).strip().lower()
+    }
+    
+    # Investment analysis patterns, compiled once into a single alternation
+    INVESTMENT_PATTERN = re.compile("|".join([
+        r"analyze .+ stock",
+        r"investment analysis",
+        r"stock price",
+        r"financial data",
+        r"company metrics",
+        r"P/E ratio",
+        r"market cap",
+        r"revenue",
+        r"earnings"
+    ]), re.IGNORECASE)
+    
+    # Common ticker patterns, tried in order against the upper-cased query
+    TICKER_PATTERNS = (
+        re.compile(r'\b([A-Z]{1,5})\b'),  # 1-5 uppercase letters
+        re.compile(r'ticker\s+([A-Z]{1,5})'),  # "ticker AAPL"
+        re.compile(r'stock\s+([A-Z]{1,5})'),   # "stock AAPL"
+    )
+    
+    # Company name to ticker mapping (common ones)
+    COMPANY_TICKERS = {
+        'apple': 'AAPL',
+        'microsoft': 'MSFT',
+        'google': 'GOOGL',
+        'alphabet': 'GOOGL',
+        'amazon': 'AMZN',
+        'tesla': 'TSLA',
+        'meta': 'META',
+        'facebook': 'META',
+        'netflix': 'NFLX',
+        'nvidia': 'NVDA'
+    }
+    
+    # All company names in one alternation so a query is scanned once
+    COMPANY_PATTERN = re.compile("|".join(map(re.escape, COMPANY_TICKERS)))
+    
+    PROFESSIONAL_CONTEXT = """You are a professional investment analysis assistant for a brokerage company. 
+You help investment consultants and clients with financial questions and analysis. 
+Provide accurate, well-structured responses with appropriate financial disclaimers when relevant.
+Be conversational but maintain professional standards.
+
+User question: """
+    
+    # Try multiple Claude Sonnet models in order of preference
+    MODEL_OPTIONS = (
+        "anthropic.claude-3-5-sonnet-20241022-v2:0",  # Latest Claude 3.5 Sonnet v2
+        "anthropic.claude-3-5-sonnet-20240620-v1:0",  # Claude 3.5 Sonnet
+        "anthropic.claude-3-sonnet-20240229-v1:0",    # Standard Claude 3 Sonnet
+        "anthropic.claude-v2:0",                      # Fallback to Claude v2
+    )
+    
     def __init__(self, region: Optional[str] = None):
         self.logger = get_logger("BedrockAgentAdapter")
         self.analyzer = SequentialInvestmentAnalyzer()
@@ -30,14 +87,7 @@ class BedrockAgentAdapter:
         
         # Initialize AWS credentials and clients
         self.bedrock_runtime = None
-        # Try multiple Claude Sonnet models in order of preference
-        self.model_options = [
-            "anthropic.claude-3-5-sonnet-20241022-v2:0",  # Latest Claude 3.5 Sonnet v2
-            "anthropic.claude-3-5-sonnet-20240620-v1:0",  # Claude 3.5 Sonnet
-            "anthropic.claude-3-sonnet-20240229-v1:0",    # Standard Claude 3 Sonnet
-            "anthropic.claude-v2:0",                      # Fallback to Claude v2
-        ]
-        self.model_id = self.model_options[0]  # Start with the best model
+        self.model_id = self.MODEL_OPTIONS[0]  # Start with the best model
         self.credentials_configured = False
         
         # Initialize AWS clients with credential handling
@@ -159,9 +209,8 @@ class BedrockAgentAdapter:
         """Handle Bedrock Agent tool request (existing functionality preserved)"""
         try:
             # Extract parameters from Bedrock Agent format
-            action_group = event.get("actionGroup", "")
             function_name = event.get("function", "")
-            parameters = event.get("parameters", {})
+            parameters = self._extract_parameters(event.get("parameters"))
             
             self.logger.info(f"Processing Bedrock Agent request: {function_name}")
             
@@ -176,6 +225,26 @@ class BedrockAgentAdapter:
             self.logger.error(f"Bedrock Agent request failed: {str(e)}")
             return self._error_response(str(e))
     
+    def _extract_parameters(self, parameters: Any) -> Dict[str, Any]:
+        """
+        Normalize Bedrock Agent parameters into a name -> value dict in one pass.
+        Accepts the agent's list of {"name", "type", "value"} entries as well as
+        a plain dict (local tests and examples).
+        """
+        if isinstance(parameters, dict):
+            items = parameters.items()
+        elif isinstance(parameters, list):
+            items = ((param["name"], param.get("value")) for param in parameters
+                     if isinstance(param, dict) and "name" in param)
+        else:
+            return {}
+        
+        extracted = {}
+        for name, value in items:
+            coerce = self.PARAMETER_COERCIONS.get(name)
+            extracted[name] = coerce(value) if coerce and value is not None else value
+        return extracted
+    
     def handle_user_query(self, query: str) -> str:
         """Handle user query with hybrid routing (NEW: Real LLM Integration)"""
         try:
@@ -197,25 +266,9 @@ class BedrockAgentAdapter:
     
     def _route_query(self, query: str) -> str:
         """Route query to appropriate handler based on content"""
-        query_lower = query.lower()
-        
-        # Investment analysis patterns
-        investment_patterns = [
-            r"analyze .+ stock",
-            r"investment analysis",
-            r"stock price",
-            r"financial data",
-            r"company metrics",
-            r"P/E ratio",
-            r"market cap",
-            r"revenue",
-            r"earnings"
-        ]
-        
         # Check for investment-related queries
-        for pattern in investment_patterns:
-            if re.search(pattern, query_lower):
-                return "tool"
+        if self.INVESTMENT_PATTERN.search(query):
+            return "tool"
         
         # Default to conversation for general queries
         return "conversation"
@@ -266,7 +319,7 @@ class BedrockAgentAdapter:
         })
         
         # Try each model in order of preference
-        for i, model_id in enumerate(self.model_options):
+        for i, model_id in enumerate(self.MODEL_OPTIONS):
             try:
                 self.logger.info(f"Attempting LLM call with model: {model_id}")
                 
@@ -288,7 +341,7 @@ class BedrockAgentAdapter:
                 self.logger.warning(f"Model {model_id} failed with error {error_code}: {str(e)}")
                 
                 # If this is the last model, raise the exception
-                if i == len(self.model_options) - 1:
+                if i == len(self.MODEL_OPTIONS) - 1:
                     self.logger.error(f"All models failed. Last error: {str(e)}")
                     raise e
                 
@@ -298,7 +351,7 @@ class BedrockAgentAdapter:
                 self.logger.warning(f"Model {model_id} failed with unexpected error: {str(e)}")
                 
                 # If this is the last model, raise the exception
-                if i == len(self.model_options) - 1:
+                if i == len(self.MODEL_OPTIONS) - 1:
                     self.logger.error(f"All models failed. Last error: {str(e)}")
                     raise e
                 
@@ -325,48 +378,19 @@ class BedrockAgentAdapter:
     
     def _add_professional_context(self, prompt: str) -> str:
         """Add professional context to LLM prompts"""
-        context = """You are a professional investment analysis assistant for a brokerage company. 
-You help investment consultants and clients with financial questions and analysis. 
-Provide accurate, well-structured responses with appropriate financial disclaimers when relevant.
-Be conversational but maintain professional standards.
-
-User question: """
-        
-        return context + prompt
+        return self.PROFESSIONAL_CONTEXT + prompt
     
     def _extract_ticker_from_query(self, query: str) -> str:
         """Extract stock ticker from user query"""
-        # Common ticker patterns
-        ticker_patterns = [
-            r'\b([A-Z]{1,5})\b',  # 1-5 uppercase letters
-            r'ticker\s+([A-Z]{1,5})',  # "ticker AAPL"
-            r'stock\s+([A-Z]{1,5})',   # "stock AAPL"
-        ]
-        
-        # Company name to ticker mapping (common ones)
-        company_mapping = {
-            'apple': 'AAPL',
-            'microsoft': 'MSFT',
-            'google': 'GOOGL',
-            'alphabet': 'GOOGL',
-            'amazon': 'AMZN',
-            'tesla': 'TSLA',
-            'meta': 'META',
-            'facebook': 'META',
-            'netflix': 'NFLX',
-            'nvidia': 'NVDA'
-        }
-        
-        query_lower = query.lower()
-        
         # Check company names first
-        for company, ticker in company_mapping.items():
-            if company in query_lower:
-                return ticker
+        match = self.COMPANY_PATTERN.search(query.lower())
+        if match:
+            return self.COMPANY_TICKERS[match.group(0)]
         
         # Check ticker patterns
-        for pattern in ticker_patterns:
-            match = re.search(pattern, query.upper())
+        query_upper = query.upper()
+        for pattern in self.TICKER_PATTERNS:
+            match = pattern.search(query_upper)
             if match:
                 return match.group(1)
         
@@ -391,8 +415,8 @@ User question: """
     
     def _analyze_investment(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze investment using existing Lambda function"""
-        ticker = parameters.get("ticker", "").upper()
-        depth = parameters.get("depth", "standard")
+        ticker = parameters.get("ticker") or ""
+        depth = parameters.get("depth") or "standard"
         
         if not ticker:
             return self._error_response("Missing required parameter: ticker")
@@ -402,24 +426,8 @@ User question: """
         
         if result.get("success"):
             # Format for Bedrock Agent consumption
-            analysis = result["analysis"]
-            recommendation = analysis["recommendation"]
-            
-            response_text = self._format_investment_response(ticker, analysis)
-            
-            return {
-                "response": {
-                    "actionGroup": "InvestmentTools",
-                    "function": "analyze_investment",
-                    "functionResponse": {
-                        "responseBody": {
-                            "TEXT": {
-                                "body": response_text
-                            }
-                        }
-                    }
-                }
-            }
+            response_text = self._format_investment_response(ticker, result["analysis"])
+            return self._agent_response("analyze_investment", response_text)
         else:
             return self._error_response(result.get("error", "Analysis failed"))
     
@@ -455,39 +463,41 @@ User question: """
     
     def _get_financial_data(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """Get financial data (placeholder for future implementation)"""
-        ticker = parameters.get("ticker", "").upper()
+        ticker = parameters.get("ticker") or ""
         
-        return {
-            "response": {
-                "actionGroup": "InvestmentTools", 
-                "function": "get_financial_data",
-                "functionResponse": {
-                    "responseBody": {
-                        "TEXT": {
-                            "body": f"Financial data retrieval for {ticker} - Feature coming soon!"
-                        }
-                    }
-                }
-            }
-        }
+        return self._agent_response(
+            "get_financial_data", f"Financial data retrieval for {ticker} - Feature coming soon!"
+        )
     
     def _error_response(self, error_message: str) -> Dict[str, Any]:
         """Format error response for Bedrock Agent"""
+        return self._agent_response("error", f"❌ Error: {error_message}")
+    
+    def _agent_response(self, function_name: str, body: str) -> Dict[str, Any]:
+        """Wrap a text body in the Bedrock Agent function response envelope"""
         return {
             "response": {
                 "actionGroup": "InvestmentTools",
-                "function": "error",
+                "function": function_name,
                 "functionResponse": {
                     "responseBody": {
                         "TEXT": {
-                            "body": f"❌ Error: {error_message}"
+                            "body": body
                         }
                     }
                 }
             }
         }
 
+
+# Adapter reused across warm invocations; created on the first request so
+# importing this module does not touch AWS credentials
+_adapter = None
+
+
 def lambda_handler(event, context):
     """Lambda handler for Bedrock Agent integration"""
-    adapter = BedrockAgentAdapter()
-    return adapter.handle_agent_request(event)
+    global _adapter
+    if _adapter is None:
+        _adapter = BedrockAgentAdapter()
+    return _adapter.handle_agent_request(event)
@@ -7,14 +7,16 @@ Designed for Amazon Bedrock Agent integration with <2s response time
 
 import json
 import sys
-import os
 import time
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, List
 
 from logger import get_logger
 from yahoo_finance_client import yahoo_client
 
+# Canonical analysis depths accepted by the handler
+SUPPORTED_DEPTHS = frozenset(['quick', 'standard', 'detailed'])
+
 
 class SequentialInvestmentAnalyzer:
     """
@@ -27,22 +29,26 @@ class SequentialInvestmentAnalyzer:
     Designed for board demonstration of AWS chatbot capabilities
     """
     
+    # Essential metrics for Phase 1 (fast, reliable): (Yahoo field, Phase 1 key)
+    essential_metrics = (
+        ('currentPrice', 'current_price'),
+        ('forwardPE', 'forward_pe'),
+        ('returnOnEquity', 'return_on_equity'),
+        ('debtToEquity', 'debt_to_equity'),
+        ('profitMargins', 'profit_margins'),
+        ('marketCap', 'market_cap')
+    )
+    
+    # Enhanced metrics for Phase 2 (when time permits)
+    enhanced_metrics = (
+        'beta', 'earningsGrowth', 'revenueGrowth', 'dividendYield',
+        'sector', 'industry', 'trailingPE', 'priceToBook'
+    )
+    
     def __init__(self):
         self.logger = get_logger("InvestmentMetricsLambda")
         self.start_time = None
         self.phase_times = {}
-        
-        # Essential metrics for Phase 1 (fast, reliable)
-        self.essential_metrics = [
-            'currentPrice', 'forwardPE', 'returnOnEquity', 
-            'debtToEquity', 'profitMargins', 'marketCap'
-        ]
-        
-        # Enhanced metrics for Phase 2 (when time permits)
-        self.enhanced_metrics = [
-            'beta', 'earningsGrowth', 'revenueGrowth', 'dividendYield',
-            'sector', 'industry', 'trailingPE', 'priceToBook'
-        ]
     
     def analyze(self, ticker: str, depth: str = "standard") -> Dict[str, Any]:
         """
@@ -56,6 +62,7 @@ class SequentialInvestmentAnalyzer:
             Comprehensive analysis results with performance metrics
         """
         self.start_time = time.time()
+        self.phase_times = {}
         self.logger.info(f"🚀 Starting sequential analysis for {ticker} (depth: {depth})")
         
         try:
@@ -69,7 +76,9 @@ class SequentialInvestmentAnalyzer:
             
             # Phase 2: Enhanced Analysis (CONDITIONAL)
             phase2_start = time.time()
-            enhanced_data = self._phase2_enhanced_analysis(ticker, depth)
+            enhanced_data = self._phase2_enhanced_analysis(
+                ticker, depth, essential_data['stock_data']
+            )
             self.phase_times['phase2'] = time.time() - phase2_start
             
             # Phase 3: Recommendation Generation
@@ -108,18 +117,12 @@ class SequentialInvestmentAnalyzer:
                 }
             
             # Extract essential metrics
-            essential_data = {
-                'company_name': stock_data.get('longName', ticker),
-                'current_price': stock_data.get('currentPrice'),
-                'forward_pe': stock_data.get('forwardPE'),
-                'return_on_equity': stock_data.get('returnOnEquity'),
-                'debt_to_equity': stock_data.get('debtToEquity'),
-                'profit_margins': stock_data.get('profitMargins'),
-                'market_cap': stock_data.get('marketCap'),
-                'currency': stock_data.get('currency', 'USD'),
-                'exchange': stock_data.get('exchange'),
-                'retrieved_at': datetime.now().isoformat()
-            }
+            essential_data = {'company_name': stock_data.get('longName', ticker)}
+            for field, key in self.essential_metrics:
+                essential_data[key] = stock_data.get(field)
+            essential_data['currency'] = stock_data.get('currency', 'USD')
+            essential_data['exchange'] = stock_data.get('exchange')
+            essential_data['retrieved_at'] = stock_data.get('retrieved_at') or datetime.now().isoformat()
             
             # Validate essential data
             data_quality = self._assess_data_quality(essential_data)
@@ -129,7 +132,8 @@ class SequentialInvestmentAnalyzer:
             return {
                 'success': True,
                 'data': essential_data,
-                'data_quality': data_quality
+                'data_quality': data_quality,
+                'stock_data': stock_data
             }
             
         except Exception as e:
@@ -139,10 +143,12 @@ class SequentialInvestmentAnalyzer:
                 'error': f'Failed to retrieve essential metrics: {str(e)}'
             }
     
-    def _phase2_enhanced_analysis(self, ticker: str, depth: str) -> Dict[str, Any]:
+    def _phase2_enhanced_analysis(self, ticker: str, depth: str, 
+                                  stock_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Phase 2: Enhanced analysis with market context (conditional execution)
-        Executes based on depth parameter and available time
+        Executes based on depth parameter and available time, reusing the
+        stock data already retrieved in Phase 1
         """
         # Skip enhanced analysis for 'quick' depth or if Phase 1 took too long
         elapsed_time = time.time() - self.start_time
@@ -153,9 +159,6 @@ class SequentialInvestmentAnalyzer:
         self.logger.info(f"🔍 Phase 2: Enhanced analysis for {ticker}")
         
         try:
-            # Get additional stock data
-            stock_data = yahoo_client.get_stock_info(ticker)
-            
             enhanced_data = {
                 'sector': stock_data.get('sector'),
                 'industry': stock_data.get('industry'),
@@ -182,7 +185,7 @@ class SequentialInvestmentAnalyzer:
             }
             
         except Exception as e:
-            self.logger.warning(f"⚠️ Phase 2 failed for {ticker}", error=e)
+            self.logger.warning(f"⚠️ Phase 2 failed for {ticker}", context={"error": str(e)})
             return {
                 'executed': False,
                 'error': str(e)
@@ -266,10 +269,8 @@ class SequentialInvestmentAnalyzer:
     
     def _assess_data_quality(self, data: Dict[str, Any]) -> int:
         """Assess the quality of retrieved data (0-100%)"""
-        total_fields = len(self.essential_metrics)
-        available_fields = sum(1 for field in self.essential_metrics 
-                             if data.get(field.replace('_', '')) is not None)
-        return int((available_fields / total_fields) * 100)
+        available_fields = sum(1 for _, key in self.essential_metrics if data.get(key) is not None)
+        return int((available_fields / len(self.essential_metrics)) * 100)
     
     def _assess_risk_profile(self, stock_data: Dict[str, Any]) -> str:
         """Assess overall risk profile"""
@@ -492,6 +493,13 @@ class SequentialInvestmentAnalyzer:
                                enhanced_data: Dict[str, Any], recommendation: Dict[str, Any], 
                                total_time: float) -> Dict[str, Any]:
         """Format successful analysis response"""
+        phase_times = {}
+        phases_executed = 0
+        for phase, elapsed in self.phase_times.items():
+            phase_times[phase] = round(elapsed, 3)
+            if elapsed > 0:
+                phases_executed += 1
+        
         return {
             'ticker': ticker,
             'success': True,
@@ -502,9 +510,9 @@ class SequentialInvestmentAnalyzer:
             },
             'performance': {
                 'total_execution_time': round(total_time, 3),
-                'phase_times': {k: round(v, 3) for k, v in self.phase_times.items()},
+                'phase_times': phase_times,
                 'algorithm': 'Sequential Processing',
-                'phases_executed': len([k for k, v in self.phase_times.items() if v > 0])
+                'phases_executed': phases_executed
             },
             'metadata': {
                 'timestamp': datetime.now().isoformat(),
@@ -538,6 +546,11 @@ class SequentialInvestmentAnalyzer:
         }
 
 
+# Global instances reused across warm invocations
+sequential_analyzer = SequentialInvestmentAnalyzer()
+logger = get_logger("InvestmentMetricsLambda")
+
+
 # Lambda handler function
 def lambda_handler(event, context):
     """
@@ -551,8 +564,6 @@ def lambda_handler(event, context):
         "requestId": "optional-request-id"
     }
     """
-    logger = get_logger("InvestmentMetricsLambda")
-    
     try:
         # Extract parameters from event
         ticker = event.get('ticker', '').upper()
@@ -570,13 +581,16 @@ def lambda_handler(event, context):
         if not ticker:
             raise ValueError("Missing required parameter: ticker")
         
-        if depth not in ['quick', 'standard', 'detailed']:
+        if depth not in SUPPORTED_DEPTHS:
+            # Normalise only when the agent sends a non-canonical value
+            depth = str(depth).strip().lower()
+        
+        if depth not in SUPPORTED_DEPTHS:
             depth = 'standard'
             logger.warning(f"Invalid depth parameter, defaulting to 'standard'")
         
         # Perform sequential analysis
-        analyzer = SequentialInvestmentAnalyzer()
-        result = analyzer.analyze(ticker, depth)
+        result = sequential_analyzer.analyze(ticker, depth)
         
         # Format response for Bedrock Agent
         response = {
@@ -633,37 +647,8 @@ if __name__ == "__main__":
         {"ticker": "GOOGL", "depth": "quick", "requestId": "board-demo-003"}
     ]
     
-    print("AWS Chatbot Investment Analysis - Board Demonstration")
-    print("=" * 60)
-    
-    for i, test_event in enumerate(test_cases, 1):
-        print(f"Test Case {i}: {test_event['ticker']} ({test_event['depth']} analysis)")
-        print("-" * 40)
-        
-        result = lambda_handler(test_event, None)
-        
-        if result['statusCode'] == 200:
-            data = json.loads(result['body'])
-            if data['success']:
-                analysis = data['analysis']
-                perf = data['performance']
-                
-                print(f"Success: {analysis['recommendation']['recommendation']}")
-                print(f"Execution Time: {perf['total_execution_time']}s")
-            else:
-                print(f"Failed: {data['error']}")
-        else:
-            print(f"HTTP Error: {result['statusCode']}")
-    
-    print("=" * 60)
-    print("Board Demonstration Complete - AWS Chatbot Ready!")
-if __name__ == "__main__":
-    # Test cases for board demonstration
-    test_cases = [
-        {"ticker": "AAPL", "depth": "detailed", "requestId": "board-demo-001"},
-        {"ticker": "MSFT", "depth": "standard", "requestId": "board-demo-002"},
-        {"ticker": "GOOGL", "depth": "quick", "requestId": "board-demo-003"}
-    ]
+    # --quiet prints only per-case outcome, e.g. when timing the handler
+    quiet = '--quiet' in sys.argv
     
     print("🎯 AWS Chatbot Investment Analysis - Board Demonstration")
     print("=" * 60)
@@ -682,9 +667,10 @@ if __name__ == "__main__":
                 
                 print(f"✅ Success: {analysis['recommendation']['recommendation']}")
                 print(f"⏱️  Execution Time: {perf['total_execution_time']}s")
-                print(f"📈 Score: {analysis['recommendation']['score']}/100")
-                print(f"🎯 Board Summary:")
-                print(analysis['recommendation']['board_summary'])
+                if not quiet:
+                    print(f"📈 Score: {analysis['recommendation']['score']}/100")
+                    print(f"🎯 Board Summary:")
+                    print(analysis['recommendation']['board_summary'])
             else:
                 print(f"❌ Failed: {data['error']}")
         else:
@@ -6,8 +6,14 @@ Provides structured logging for CloudWatch integration
 import json
 import logging
 import sys
-from datetime import datetime
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, Optional, Tuple
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time in ISO 8601 format with microseconds"""
+    now = time.time()
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(now)) + '.%06d' % int(now % 1 * 1000000)
 
 
 class CloudWatchLogger:
@@ -16,13 +22,15 @@ class CloudWatchLogger:
     Provides structured JSON logging for better CloudWatch analysis.
     """
     
+    __slots__ = ('function_name', 'logger')
+    
     def __init__(self, function_name: str, log_level: str = "INFO"):
         self.function_name = function_name
         self.logger = logging.getLogger(function_name)
         self.logger.setLevel(getattr(logging, log_level.upper()))
         
         # Remove existing handlers to avoid duplicates
-        for handler in self.logger.handlers:
+        for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
         
         # Create console handler for CloudWatch
@@ -35,7 +43,7 @@ class CloudWatchLogger:
                        error: Optional[Exception] = None) -> str:
         """Format log message as structured JSON for CloudWatch"""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "level": level,
             "function": self.function_name,
             "message": message
@@ -54,20 +62,28 @@ class CloudWatchLogger:
     
     def info(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log info level message"""
-        self.logger.info(self._format_message("INFO", message, context))
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(self._format_message("INFO", message, context))
     
     def warning(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log warning level message"""
-        self.logger.warning(self._format_message("WARNING", message, context))
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(self._format_message("WARNING", message, context))
     
     def error(self, message: str, context: Optional[Dict[str, Any]] = None, 
               error: Optional[Exception] = None):
         """Log error level message"""
-        self.logger.error(self._format_message("ERROR", message, context, error))
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(self._format_message("ERROR", message, context, error))
     
     def debug(self, message: str, context: Optional[Dict[str, Any]] = None):
         """Log debug level message"""
-        self.logger.debug(self._format_message("DEBUG", message, context))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(self._format_message("DEBUG", message, context))
+
+
+# Loggers already configured in this process, keyed by (function_name, log_level)
+_loggers: Dict[Tuple[str, str], CloudWatchLogger] = {}
 
 
 def get_logger(function_name: str, log_level: str = "INFO") -> CloudWatchLogger:
@@ -79,9 +95,13 @@ def get_logger(function_name: str, log_level: str = "INFO") -> CloudWatchLogger:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR)
     
     Returns:
-        CloudWatchLogger instance
+        CloudWatchLogger instance, shared by callers asking for the same name and level
     """
-    return CloudWatchLogger(function_name, log_level)
+    key = (function_name, log_level.upper())
+    logger = _loggers.get(key)
+    if logger is None:
+        logger = _loggers[key] = CloudWatchLogger(function_name, log_level)
+    return logger
 
 
 def get_lambda_logger(function_name: str, log_level: str = "INFO") -> CloudWatchLogger:
@@ -96,4 +116,4 @@ def get_lambda_logger(function_name: str, log_level: str = "INFO") -> CloudWatch
     Returns:
         CloudWatchLogger instance
     """
-    return CloudWatchLogger(function_name, log_level) 
\ No newline at end of file
+    return get_logger(function_name, log_level) 
\ No newline at end of file
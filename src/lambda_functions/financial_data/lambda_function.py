@@ -5,8 +5,6 @@ Designed for Amazon Bedrock Agent integration
 """
 
 import json
-import sys
-import os
 from datetime import datetime
 from typing import Dict, Any, Optional
 
@@ -20,9 +18,22 @@ class FinancialDataService:
     Supports multiple data types including overview, earnings, historical data.
     """
     
+    # Data type -> handler method name (one dict lookup routes each request)
+    DATA_HANDLERS = {
+        'overview': '_get_overview_data',
+        'earnings': '_get_earnings_data',
+        'historical': '_get_historical_data',
+        'profile': '_get_profile_data',
+        'metrics': '_get_metrics_data'
+    }
+    
+    # Data types whose handler also receives additional_params
+    PARAMETERIZED_DATA_TYPES = frozenset(['historical'])
+    
+    __slots__ = ('logger',)
+    
     def __init__(self):
         self.logger = get_logger("FinancialDataLambda")
-        self.supported_data_types = ['overview', 'earnings', 'historical', 'profile', 'metrics']
     
     def get_financial_data(self, ticker: str, data_type: str = 'overview', 
                           additional_params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -45,35 +56,29 @@ class FinancialDataService:
             if not ticker:
                 return self._error_response("Ticker symbol is required")
             
-            if data_type not in self.supported_data_types:
-                return self._error_response(f"Unsupported data type: {data_type}. Supported: {self.supported_data_types}")
+            if data_type not in self.DATA_HANDLERS:
+                return self._error_response(f"Unsupported data type: {data_type}. Supported: {list(self.DATA_HANDLERS)}")
             
             # Validate ticker exists
             if not yahoo_client.validate_ticker(ticker):
                 return self._error_response(f"Invalid ticker symbol: {ticker}")
             
             # Route to appropriate data retrieval method
-            if data_type == 'overview':
-                data = self._get_overview_data(ticker)
-            elif data_type == 'earnings':
-                data = self._get_earnings_data(ticker)
-            elif data_type == 'historical':
-                data = self._get_historical_data(ticker, additional_params or {})
-            elif data_type == 'profile':
-                data = self._get_profile_data(ticker)
-            elif data_type == 'metrics':
-                data = self._get_metrics_data(ticker)
+            handler = getattr(self, self.DATA_HANDLERS[data_type])
+            if data_type in self.PARAMETERIZED_DATA_TYPES:
+                data = handler(ticker, additional_params or {})
             else:
-                return self._error_response(f"Data type handler not implemented: {data_type}")
+                data = handler(ticker)
             
-            # Prepare successful response
+            # Prepare successful response (one clock read per response)
+            timestamp = datetime.now().isoformat()
             result = {
                 'ticker': ticker,
                 'data_type': data_type,
                 'success': True,
                 'data': data,
-                'timestamp': datetime.now().isoformat(),
-                'retrieved_at': data.get('retrieved_at') if isinstance(data, dict) else datetime.now().isoformat()
+                'timestamp': timestamp,
+                'retrieved_at': data.get('retrieved_at') if isinstance(data, dict) else timestamp
             }
             
             self.logger.info(f"Successfully retrieved {data_type} data for {ticker}")
@@ -225,6 +230,11 @@ class FinancialDataService:
         }
 
 
+# Global instances reused across warm invocations
+financial_data_service = FinancialDataService()
+logger = get_logger("FinancialDataHandler")
+
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler for financial data requests
@@ -236,16 +246,17 @@ def lambda_handler(event, context):
         "additional_params": {...}  # optional
     }
     """
-    logger = get_logger("FinancialDataHandler")
-    
     try:
-        logger.info("Financial Data Lambda function invoked", context={"event": event})
-        
         # Extract parameters from event
         ticker = event.get('ticker')
         data_type = event.get('data_type', 'overview')
         additional_params = event.get('additional_params')
         
+        # Full event is only serialized when DEBUG logging is enabled
+        logger.info("Financial Data Lambda function invoked",
+                    context={"ticker": ticker, "data_type": data_type})
+        logger.debug("Financial Data Lambda event", context={"event": event})
+        
         # Validate required parameters
         if not ticker:
             error_response = {
@@ -259,15 +270,17 @@ def lambda_handler(event, context):
             logger.warning("Missing ticker parameter in request")
             return error_response
         
-        # Initialize service and process request
-        service = FinancialDataService()
-        result = service.get_financial_data(ticker, data_type, additional_params)
+        # Process request with the shared service
+        result = financial_data_service.get_financial_data(ticker, data_type, additional_params)
+        
+        # Serialize once; default=str covers non-JSON values from yfinance
+        body = json.dumps(result, default=str)
         
         # Prepare Lambda response
         if result.get('success', False):
             response = {
                 'statusCode': 200,
-                'body': json.dumps(result),
+                'body': body,
                 'headers': {
                     'Content-Type': 'application/json'
                 }
@@ -276,7 +289,7 @@ def lambda_handler(event, context):
         else:
             response = {
                 'statusCode': 400,
-                'body': json.dumps(result),
+                'body': body,
                 'headers': {
                     'Content-Type': 'application/json'
                 }
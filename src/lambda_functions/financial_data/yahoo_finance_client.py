@@ -4,13 +4,18 @@ Implements error handling and fallback mechanisms for reliability
 """
 
 import yfinance as yf
-from typing import Dict, Any, Optional, List
+from collections import OrderedDict
+from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
-import json
+import string
 import time
 
 from logger import get_logger
 
+# Characters that can appear in a Yahoo Finance symbol (e.g. BRK-B, ^GSPC, EURUSD=X, 7203.T, M&M.NS)
+TICKER_CHARACTERS = frozenset(string.ascii_uppercase + string.digits + '.-^=&')
+MAX_TICKER_LENGTH = 20
+
 
 class YahooFinanceClient:
     """
@@ -18,11 +23,14 @@ class YahooFinanceClient:
     Implements circuit breaker pattern for reliability.
     """
     
-    def __init__(self, cache_duration_minutes: int = 30, max_retries: int = 3):
+    def __init__(self, cache_duration_minutes: int = 30, max_retries: int = 3,
+                 max_cache_entries: int = 256):
         self.logger = get_logger("YahooFinanceClient")
         self.cache_duration = timedelta(minutes=cache_duration_minutes)
         self.max_retries = max_retries
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self.max_cache_entries = max_cache_entries
+        # Least recently used entries first, so warm containers stay bounded
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
         
     def _is_cache_valid(self, ticker: str) -> bool:
         """Check if cached data is still valid"""
@@ -38,8 +46,12 @@ class YahooFinanceClient:
     def _get_cached_data(self, ticker: str) -> Optional[Dict[str, Any]]:
         """Get cached data if valid"""
         if self._is_cache_valid(ticker):
+            self._cache.move_to_end(ticker)
             self.logger.info(f"Using cached data for {ticker}")
             return self._cache[ticker]['data']
+        
+        # Drop the expired entry rather than keeping it until eviction
+        self._cache.pop(ticker, None)
         return None
     
     def _cache_data(self, ticker: str, data: Dict[str, Any]):
@@ -48,6 +60,11 @@ class YahooFinanceClient:
             'data': data,
             'timestamp': datetime.now()
         }
+        self._cache.move_to_end(ticker)
+        
+        # Evict least recently used entries beyond the size limit
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
     
     def _retry_request(self, func, *args, **kwargs) -> Any:
         """Retry mechanism for API requests"""
@@ -55,7 +72,7 @@ class YahooFinanceClient:
         
         for attempt in range(self.max_retries):
             try:
-                self.logger.debug(f"API request attempt {attempt + 1}")
+                self.logger.debug("API request attempt", context={"attempt": attempt + 1})
                 return func(*args, **kwargs)
             except Exception as e:
                 last_exception = e
@@ -88,35 +105,14 @@ class YahooFinanceClient:
         try:
             def _fetch_data():
                 stock = yf.Ticker(ticker)
-                info = stock.info
-                
-                # Extract key financial metrics
-                extracted_data = {
-                    'symbol': ticker,
-                    'name': info.get('longName', ticker),
-                    'currentPrice': info.get('currentPrice'),
-                    'forwardPE': info.get('forwardPE'),
-                    'returnOnEquity': info.get('returnOnEquity'),
-                    'debtToEquity': info.get('debtToEquity'),
-                    'profitMargins': info.get('profitMargins'),
-                    'earningsGrowth': info.get('earningsGrowth'),
-                    'revenueGrowth': info.get('revenueGrowth'),
-                    'sector': info.get('sector'),
-                    'industry': info.get('industry'),
-                    'marketCap': info.get('marketCap'),
-                    'beta': info.get('beta'),
-                    'dividendYield': info.get('dividendYield'),
-                    'enterpriseValue': info.get('enterpriseValue'),
-                    'ebitda': info.get('ebitda'),
-                    'retrieved_at': datetime.now().isoformat()
-                }
-                
-                return extracted_data
+                return stock.info
             
-            data = self._retry_request(_fetch_data)
+            info = self._retry_request(_fetch_data)
+            data = self._extract_stock_info(ticker, info)
             
-            # Cache the successful result
-            self._cache_data(ticker, data)
+            # Cache only symbols Yahoo recognizes, so validate_ticker can trust a cache hit
+            if self._is_known_symbol(info):
+                self._cache_data(ticker, data)
             
             self.logger.info(f"Successfully retrieved data for {ticker}")
             return data
@@ -125,6 +121,33 @@ class YahooFinanceClient:
             self.logger.error(f"Failed to retrieve data for {ticker}", error=e)
             raise Exception(f"Unable to fetch data for {ticker}: {str(e)}")
     
+    @staticmethod
+    def _is_known_symbol(info: Dict[str, Any]) -> bool:
+        """Check whether a yfinance info dict describes a real symbol"""
+        return bool(info.get('symbol') or info.get('longName'))
+    
+    def _extract_stock_info(self, ticker: str, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract key financial metrics from a yfinance info dict"""
+        return {
+            'symbol': ticker,
+            'name': info.get('longName', ticker),
+            'currentPrice': info.get('currentPrice'),
+            'forwardPE': info.get('forwardPE'),
+            'returnOnEquity': info.get('returnOnEquity'),
+            'debtToEquity': info.get('debtToEquity'),
+            'profitMargins': info.get('profitMargins'),
+            'earningsGrowth': info.get('earningsGrowth'),
+            'revenueGrowth': info.get('revenueGrowth'),
+            'sector': info.get('sector'),
+            'industry': info.get('industry'),
+            'marketCap': info.get('marketCap'),
+            'beta': info.get('beta'),
+            'dividendYield': info.get('dividendYield'),
+            'enterpriseValue': info.get('enterpriseValue'),
+            'ebitda': info.get('ebitda'),
+            'retrieved_at': datetime.now().isoformat()
+        }
+    
     def get_earnings_data(self, ticker: str) -> Dict[str, Any]:
         """
         Get earnings data for a ticker
@@ -136,6 +159,12 @@ class YahooFinanceClient:
             Dictionary containing earnings information
         """
         ticker = ticker.upper()
+        cache_key = f"{ticker}:earnings"
+        
+        # Check cache first
+        cached_data = self._get_cached_data(cache_key)
+        if cached_data:
+            return cached_data
         
         try:
             def _fetch_earnings():
@@ -156,6 +185,10 @@ class YahooFinanceClient:
                 }
             
             data = self._retry_request(_fetch_earnings)
+            
+            # Cache the successful result
+            self._cache_data(cache_key, data)
+            
             self.logger.info(f"Successfully retrieved earnings data for {ticker}")
             return data
             
@@ -173,15 +206,34 @@ class YahooFinanceClient:
         Returns:
             True if ticker exists, False otherwise
         """
+        if not ticker:
+            return False
+        
+        ticker = ticker.upper()
+        
+        # Reject malformed symbols without an API round trip
+        if len(ticker) > MAX_TICKER_LENGTH or not TICKER_CHARACTERS.issuperset(ticker):
+            return False
+        
+        # Stock info is only cached for validated symbols
+        if self._get_cached_data(ticker):
+            return True
+        
         try:
-            stock = yf.Ticker(ticker.upper())
+            stock = yf.Ticker(ticker)
             info = stock.info
             
             # Check if we got valid data
-            return bool(info.get('symbol') or info.get('longName'))
+            is_valid = self._is_known_symbol(info)
+            
+            # Keep the fetched info so a following get_stock_info() skips the API
+            if is_valid:
+                self._cache_data(ticker, self._extract_stock_info(ticker, info))
+            
+            return is_valid
             
         except Exception as e:
-            self.logger.warning(f"Ticker validation failed for {ticker}", error=e)
+            self.logger.warning(f"Ticker validation failed for {ticker}", context={"error": str(e)})
             return False
     
     def clear_cache(self):
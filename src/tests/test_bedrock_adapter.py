@@ -0,0 +1,76 @@
+"""
+Unit tests for the Bedrock Agent adapter.
+Tests parameter extraction from the Bedrock Agent event formats.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import patch
+
+# Add the Bedrock agent directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'bedrock_agent'))
+
+from bedrock_adapter import BedrockAgentAdapter
+
+
+class TestParameterExtraction(unittest.TestCase):
+    """Test cases for Bedrock Agent parameter handling."""
+
+    def setUp(self):
+        """Set up an adapter without touching AWS."""
+        with patch.object(BedrockAgentAdapter, '_init_bedrock_client'):
+            self.adapter = BedrockAgentAdapter()
+
+    def _response_body(self, result):
+        """Extract the text body from an agent response."""
+        return result["response"]["functionResponse"]["responseBody"]["TEXT"]["body"]
+
+    def test_list_parameters_reach_analyzer_normalized(self):
+        """Test the agent's list-of-entries format with ticker and depth coercion."""
+        event = {
+            "actionGroup": "InvestmentTools",
+            "function": "analyze_investment",
+            "parameters": [
+                {"name": "ticker", "type": "string", "value": " aapl "},
+                {"name": "depth", "type": "string", "value": "Detailed"}
+            ]
+        }
+
+        with patch.object(self.adapter.analyzer, 'analyze',
+                          return_value={"success": False, "error": "stubbed"}) as analyze:
+            self.adapter.handle_agent_request(event)
+
+        analyze.assert_called_once_with("AAPL", "detailed")
+
+    def test_dict_parameters_are_coerced(self):
+        """Test the plain dict format used by local tests and examples."""
+        parameters = self.adapter._extract_parameters({"ticker": " msft", "depth": " QUICK "})
+
+        self.assertEqual(parameters, {"ticker": "MSFT", "depth": "quick"})
+
+    def test_malformed_parameters_are_ignored(self):
+        """Test that missing or malformed parameters yield an empty dict."""
+        self.assertEqual(self.adapter._extract_parameters(None), {})
+        self.assertEqual(self.adapter._extract_parameters("ticker=AAPL"), {})
+        self.assertEqual(self.adapter._extract_parameters([None, "AAPL", {"value": "AAPL"}]), {})
+        self.assertEqual(self.adapter._extract_parameters([{"name": "ticker", "value": None}]),
+                         {"ticker": None})
+
+    def test_missing_ticker_returns_error(self):
+        """Test that malformed parameter entries surface the missing-ticker error."""
+        event = {
+            "actionGroup": "InvestmentTools",
+            "function": "analyze_investment",
+            "parameters": [None, {"type": "string", "value": "AAPL"}]
+        }
+
+        with patch.object(self.adapter.analyzer, 'analyze') as analyze:
+            result = self.adapter.handle_agent_request(event)
+
+        analyze.assert_not_called()
+        self.assertIn("Missing required parameter: ticker", self._response_body(result))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Unit tests for Investment Metrics Lambda function.
+Tests Phase 1 essential metrics extraction and data quality scoring.
+"""
+
+import unittest
+import importlib.util
+import sys
+import os
+from unittest.mock import patch
+
+# Add the lambda function directory to the path
+FUNCTION_DIR = os.path.join(os.path.dirname(__file__), '..', 'lambda_functions', 'investment_metrics')
+sys.path.append(FUNCTION_DIR)
+
+# Load under a distinct name; the financial data tests also import a "lambda_function"
+spec = importlib.util.spec_from_file_location(
+    "investment_metrics_lambda", os.path.join(FUNCTION_DIR, 'lambda_function.py')
+)
+investment_metrics_lambda = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(investment_metrics_lambda)
+
+
+class TestEssentialMetrics(unittest.TestCase):
+    """Test cases for Phase 1 of SequentialInvestmentAnalyzer."""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.analyzer = investment_metrics_lambda.SequentialInvestmentAnalyzer()
+
+    def _run_phase1(self, stock_data):
+        """Run Phase 1 against stubbed stock data."""
+        with patch.object(investment_metrics_lambda.yahoo_client, 'get_stock_info',
+                          return_value=stock_data):
+            return self.analyzer._phase1_essential_metrics("AAPL")
+
+    def test_complete_data_scores_full_quality(self):
+        """Test that all essential metrics present gives 100% quality."""
+        result = self._run_phase1({
+            'currentPrice': 190.5,
+            'forwardPE': 28.1,
+            'returnOnEquity': 1.5,
+            'debtToEquity': 150.0,
+            'profitMargins': 0.25,
+            'marketCap': 3000000000000
+        })
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['data_quality'], 100)
+        self.assertEqual(result['data']['current_price'], 190.5)
+        self.assertEqual(result['data']['market_cap'], 3000000000000)
+
+    def test_partial_data_scores_partial_quality(self):
+        """Test that quality reflects the share of essential metrics present."""
+        result = self._run_phase1({
+            'currentPrice': 190.5,
+            'forwardPE': 28.1,
+            'returnOnEquity': 1.5
+        })
+
+        self.assertTrue(result['success'])
+        self.assertEqual(result['data_quality'], 50)
+        self.assertIsNone(result['data']['debt_to_equity'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,6 +5,11 @@ Tests basic functionality and error handling
 
 import sys
 import os
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from common.yahoo_finance_client import YahooFinanceClient
@@ -60,6 +65,112 @@ def test_yahoo_finance_integration():
     logger.info("Yahoo Finance integration test completed successfully")
 
 
+def test_unknown_symbol_is_not_validated_from_cache():
+    """An unrecognized symbol fetched via get_stock_info must not validate later"""
+    client = YahooFinanceClient()
+    
+    with patch('common.yahoo_finance_client.yf.Ticker') as mock_ticker:
+        mock_ticker.return_value.info = {}
+        
+        assert not client.validate_ticker("ZZZZ")
+        stock_info = client.get_stock_info("ZZZZ")
+        assert stock_info['name'] == "ZZZZ"
+        assert not client.validate_ticker("ZZZZ")
+
+
+def _stub_info(ticker):
+    """Build a stubbed yf.Ticker whose info describes a known symbol"""
+    stock = MagicMock()
+    stock.info = {'symbol': ticker, 'longName': f"{ticker} Inc."}
+    return stock
+
+
+def test_cache_evicts_least_recently_used_entry():
+    """The cache keeps at most max_cache_entries, evicting the least recently used"""
+    client = YahooFinanceClient(max_cache_entries=2)
+    
+    with patch('common.yahoo_finance_client.yf.Ticker', side_effect=_stub_info) as mock_ticker:
+        client.get_stock_info("AAPL")
+        client.get_stock_info("MSFT")
+        
+        # A cache hit refreshes recency, so MSFT becomes the oldest entry
+        client.get_stock_info("AAPL")
+        assert mock_ticker.call_count == 2
+        
+        client.get_stock_info("GOOGL")
+        assert list(client._cache) == ["AAPL", "GOOGL"]
+        
+        client.get_stock_info("MSFT")
+        assert mock_ticker.call_count == 4
+
+
+def test_expired_cache_entry_is_dropped_on_lookup():
+    """An expired entry is removed from the cache when it is looked up"""
+    client = YahooFinanceClient(cache_duration_minutes=0)
+    
+    with patch('common.yahoo_finance_client.yf.Ticker', side_effect=_stub_info):
+        client.get_stock_info("AAPL")
+    assert "AAPL" in client._cache
+    
+    assert client._get_cached_data("AAPL") is None
+    assert "AAPL" not in client._cache
+
+
+def test_validate_ticker_accepts_yahoo_symbol_formats():
+    """Share classes, indices, currencies and exchange suffixes pass the syntax check"""
+    client = YahooFinanceClient()
+    
+    with patch('common.yahoo_finance_client.yf.Ticker', side_effect=_stub_info):
+        for ticker in ["BRK-B", "^GSPC", "EURUSD=X", "7203.T", "HEROMOTOCO.NS", "M&M.NS"]:
+            assert client.validate_ticker(ticker), f"{ticker} should be accepted"
+
+
+def test_validate_ticker_rejects_malformed_symbols_without_api_call():
+    """Malformed symbols are rejected before any yfinance request"""
+    client = YahooFinanceClient()
+    
+    with patch('common.yahoo_finance_client.yf.Ticker') as mock_ticker:
+        for ticker in ["bad ticker", "", "INVALID_TICKER_123", "A" * 21]:
+            assert not client.validate_ticker(ticker), f"{ticker!r} should be rejected"
+        
+        mock_ticker.assert_not_called()
+
+
+def test_earnings_data_is_cached_separately_from_stock_info():
+    """Earnings are cached under their own key and never count as a validated symbol"""
+    client = YahooFinanceClient(max_retries=1)
+    
+    with patch('common.yahoo_finance_client.yf.Ticker') as mock_ticker:
+        mock_ticker.return_value.earnings = pd.DataFrame({'Revenue': {2023: 383.3}, 'Earnings': {2023: 97.0}})
+        mock_ticker.return_value.info = {}
+        
+        first = client.get_earnings_data("AAPL")
+        second = client.get_earnings_data("AAPL")
+        assert second is first
+        assert mock_ticker.call_count == 1
+        
+        # The AAPL:earnings entry must not satisfy the stock-info cache lookup
+        assert not client.validate_ticker("AAPL")
+        assert mock_ticker.call_count == 2
+
+
+def test_failed_earnings_fetch_is_not_cached():
+    """A fetch that raises leaves no cache entry, so the next call retries the API"""
+    client = YahooFinanceClient(max_retries=1)
+    
+    with patch('common.yahoo_finance_client.yf.Ticker', side_effect=RuntimeError("network down")):
+        with pytest.raises(Exception):
+            client.get_earnings_data("AAPL")
+    assert "AAPL:earnings" not in client._cache
+    
+    with patch('common.yahoo_finance_client.yf.Ticker') as mock_ticker:
+        mock_ticker.return_value.earnings = pd.DataFrame({'Revenue': {2023: 383.3}})
+        data = client.get_earnings_data("AAPL")
+    
+    assert mock_ticker.call_count == 1
+    assert data['years'] == [2023]
+
+
 if __name__ == "__main__":
     test_yahoo_finance_integration()
     print("All tests passed!") 
\ No newline at end of file